@@ -6,6 +6,7 @@ Core agent interaction functions for running autonomous coding sessions.
 """
 
 import asyncio
+import random
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -29,10 +30,20 @@ from core.prompts import copy_spec_to_project, get_coding_prompt, get_initialize
 AUTO_CONTINUE_DELAY_SECONDS = 3
 RATE_LIMIT_FALLBACK_SLEEP_SECONDS = 30 * 60
 RATE_LIMIT_RESET_BUFFER_SECONDS = 60
+RATE_LIMIT_RESET_JITTER_SECONDS = 30
+RETRY_BACKOFF_BASE_SECONDS = 5
+RETRY_BACKOFF_MAX_ATTEMPT = 9  # 5s * 2**9 is past the 30 minute cap
+RETRY_BACKOFF_JITTER = 0.2
+RATE_LIMIT_SENTINEL = "hit your limit"
+# The CLI notice itself ("You've hit your limit · resets 3pm (...)"), as opposed
+# to the phrase turning up in the agent's own prose
+RATE_LIMIT_NOTICE_RE = re.compile(r"hit your limit\W{1,5}resets\b", re.IGNORECASE)
 RATE_LIMIT_RESET_RE = re.compile(
     r"hit your limit.*?resets\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)\s*\(([^)]+)\)",
     re.IGNORECASE | re.DOTALL,
 )
+RATE_LIMIT_TAIL_CHARS = 4096
+ERROR_TAIL_CHARS = 512
 
 
 async def run_autonomous_agent(
@@ -66,6 +77,12 @@ async def run_autonomous_agent(
     tests_file = project_dir / "feature_list.json"
     is_first_run = not tests_file.exists()
 
+    # Load prompts once, in a worker thread so file I/O never blocks the loop
+    initializer_prompt = None
+    if is_first_run:
+        initializer_prompt = await asyncio.to_thread(get_initializer_prompt, prompts_dir)
+    coding_prompt = await asyncio.to_thread(get_coding_prompt, prompts_dir)
+
     if is_first_run:
         print("Fresh start - will use initializer agent")
         print()
@@ -75,13 +92,14 @@ async def run_autonomous_agent(
         print("=" * 70)
         print()
         # Copy the app spec into the project directory for the agent to read
-        copy_spec_to_project(prompts_dir, project_dir)
+        await asyncio.to_thread(copy_spec_to_project, prompts_dir, project_dir)
     else:
         print("Continuing existing project")
         print_progress_summary(project_dir)
 
     # Main loop
     iteration = 0
+    retry_attempt = 0  # Consecutive rate-limit/error retries, drives backoff
 
     while True:
         iteration += 1
@@ -100,19 +118,20 @@ async def run_autonomous_agent(
 
         # Choose prompt based on session type
         if is_first_run:
-            prompt = get_initializer_prompt(prompts_dir)
+            prompt = initializer_prompt
             is_first_run = False  # Only use initializer once
         else:
-            prompt = get_coding_prompt(prompts_dir)
+            prompt = coding_prompt
 
         # Run session with async context manager
         status = "error"
         reset_at = None
         async with client:
-            status, response, reset_at = await _run_agent_session(client, prompt, project_dir)
+            status, reset_at = await _run_agent_session(client, prompt, project_dir)
 
         # Handle status
         if status == "continue":
+            retry_attempt = 0
             print(f"\nAgent will auto-continue in {AUTO_CONTINUE_DELAY_SECONDS}s...")
             print_progress_summary(project_dir)
             await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
@@ -122,19 +141,24 @@ async def run_autonomous_agent(
                 now = datetime.now(reset_at.tzinfo)
                 sleep_seconds = max(0, (reset_at - now).total_seconds())
                 sleep_seconds += RATE_LIMIT_RESET_BUFFER_SECONDS
+                sleep_seconds += random.uniform(0, RATE_LIMIT_RESET_JITTER_SECONDS)
                 sleep_label = _format_sleep_duration(sleep_seconds)
                 reset_label = reset_at.strftime("%Y-%m-%d %H:%M %Z")
                 print(f"\nRate limit detected. Sleeping for {sleep_label} (until {reset_label}).")
                 await asyncio.sleep(sleep_seconds)
             else:
-                sleep_label = _format_sleep_duration(RATE_LIMIT_FALLBACK_SLEEP_SECONDS)
+                sleep_seconds = _backoff_delay(retry_attempt)
+                retry_attempt = min(retry_attempt + 1, RETRY_BACKOFF_MAX_ATTEMPT)
+                sleep_label = _format_sleep_duration(sleep_seconds)
                 print(f"\nRate limit detected. Sleeping for {sleep_label} before retrying.")
-                await asyncio.sleep(RATE_LIMIT_FALLBACK_SLEEP_SECONDS)
+                await asyncio.sleep(sleep_seconds)
 
         elif status == "error":
+            sleep_seconds = _backoff_delay(retry_attempt)
+            retry_attempt = min(retry_attempt + 1, RETRY_BACKOFF_MAX_ATTEMPT)
             print("\nSession encountered an error")
-            print("Will retry with a fresh session...")
-            await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+            print(f"Will retry with a fresh session in {_format_sleep_duration(sleep_seconds)}...")
+            await asyncio.sleep(sleep_seconds)
 
         # Small delay between sessions
         if max_iterations is None or iteration < max_iterations:
@@ -166,7 +190,7 @@ async def _run_agent_session(
     client: ClaudeSDKClient,
     message: str,
     project_dir: Path,
-) -> tuple[str, str, Optional[datetime]]:
+) -> tuple[str, Optional[datetime]]:
     """
     Run a single agent session using Claude Agent SDK.
 
@@ -176,62 +200,79 @@ async def _run_agent_session(
         project_dir: Project directory path
 
     Returns:
-        (status, response_text, reset_at) where status is:
+        (status, reset_at) where status is:
         - "continue" if agent should continue working
         - "rate_limited" if usage limit was hit
         - "error" if an error occurred
     """
     print("Sending prompt to Claude Agent SDK...\n")
 
+    # Only a rolling tail of the text is kept, so the rate limit notice can be
+    # spotted as soon as it streams in without buffering the whole response
+    response_tail = ""
     try:
-        # Send the query
+        # Send the query. The prompt template is sent verbatim so the cached
+        # prefix stays stable; per-session details belong after it, not in it.
         await client.query(message)
 
-        # Collect response text and show tool use
-        response_text = ""
+        # Show text and tool use
+        limit_hit = False
+        reset_at = None
         async for msg in client.receive_response():
             # Handle AssistantMessage (text and tool use)
             if isinstance(msg, AssistantMessage):
                 for block in msg.content:
                     if isinstance(block, TextBlock):
-                        response_text += block.text
                         print(block.text, end="", flush=True)
+                        response_tail = (response_tail + block.text)[-RATE_LIMIT_TAIL_CHARS:]
+                        # Cheap substring check first; the regexes only run on a
+                        # likely notice
+                        if RATE_LIMIT_SENTINEL in response_tail.lower():
+                            notice = RATE_LIMIT_NOTICE_RE.search(response_tail)
+                            if notice:
+                                # The reset time may follow in later blocks, so
+                                # only stop early once it has been parsed
+                                limit_hit = True
+                                reset_at = _parse_rate_limit_reset(response_tail[notice.start():])
+                                if reset_at:
+                                    break
                     elif isinstance(block, ToolUseBlock):
                         print(f"\n[Tool: {block.name}]", flush=True)
-                        input_str = str(block.input)
-                        if len(input_str) > 200:
-                            print(f"   Input: {input_str[:200]}...", flush=True)
-                        else:
-                            print(f"   Input: {input_str}", flush=True)
+                        print(f"   Input: {_preview(block.input)}", flush=True)
 
             # Handle UserMessage (tool results)
             elif isinstance(msg, UserMessage):
                 if isinstance(msg.content, list):
                     for block in msg.content:
                         if isinstance(block, ToolResultBlock):
-                            result_content = block.content or ""
+                            result_str = str(block.content or "")
                             is_error = block.is_error or False
 
                             # Check if command was blocked by security hook
-                            if "blocked" in str(result_content).lower():
-                                print(f"   [BLOCKED] {result_content}", flush=True)
+                            if "blocked" in result_str.lower():
+                                print(f"   [BLOCKED] {result_str}", flush=True)
                             elif is_error:
                                 # Show errors (truncated)
-                                error_str = str(result_content)[:500]
-                                print(f"   [Error] {error_str}", flush=True)
+                                print(f"   [Error] {result_str[:500]}", flush=True)
                             else:
                                 # Tool succeeded - just show brief confirmation
                                 print("   [Done]", flush=True)
 
+            # Stop draining the stream once the rate limit notice is seen
+            if reset_at:
+                break
+
         print("\n" + "-" * 70 + "\n")
-        reset_at = _parse_rate_limit_reset(response_text)
-        if reset_at:
-            return "rate_limited", response_text, reset_at
-        return "continue", response_text, None
+        if limit_hit:
+            # reset_at is None if the notice had no parseable reset time
+            return "rate_limited", reset_at
+        return "continue", None
 
     except Exception as e:
         print(f"Error during agent session: {e}")
-        return "error", str(e), None
+        if response_tail:
+            print(f"Last output before the error:\n{response_tail[-ERROR_TAIL_CHARS:]}")
+        return "error", None
 
 
 def _parse_rate_limit_reset(response_text: str) -> Optional[datetime]:
@@ -263,10 +304,69 @@ def _parse_rate_limit_reset(response_text: str) -> Optional[datetime]:
     return reset_at
 
 
+def _backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff delay with jitter for the given retry attempt.
+
+    Doubles from RETRY_BACKOFF_BASE_SECONDS per attempt, capped at
+    RATE_LIMIT_FALLBACK_SLEEP_SECONDS, then jittered by +/-RETRY_BACKOFF_JITTER
+    so concurrent harnesses sharing an account don't retry in lockstep.
+    """
+    attempt = min(max(0, attempt), RETRY_BACKOFF_MAX_ATTEMPT)
+    delay = min(RATE_LIMIT_FALLBACK_SLEEP_SECONDS, RETRY_BACKOFF_BASE_SECONDS * 2**attempt)
+    return delay * random.uniform(1 - RETRY_BACKOFF_JITTER, 1 + RETRY_BACKOFF_JITTER)
+
+
+def _preview(value: object, limit: int = 200) -> str:
+    """
+    Render roughly str(value), cut to at most `limit` characters.
+
+    Strings are sliced before repr() and dicts/lists stop iterating once the
+    limit is passed, at every nesting level, so large payloads (file contents,
+    edit lists, todo lists) are never fully stringified. A string cut before
+    repr() may be quoted differently than str() would quote the whole value.
+    """
+    if isinstance(value, str):
+        text = value[: limit + 1]
+    elif isinstance(value, (dict, list)):
+        text = _bounded_repr(value, limit)
+    else:
+        text = str(value)
+
+    if len(text) > limit:
+        return f"{text[:limit]}..."
+    return text
+
+
+def _bounded_repr(value: object, limit: int) -> str:
+    """repr() of value that stops rendering once it is past `limit` characters."""
+    if isinstance(value, str):
+        return repr(value[: limit + 1])
+    if isinstance(value, dict):
+        items = (f"{key!r}: {_bounded_repr(item, limit)}" for key, item in value.items())
+        opening, closing = "{", "}"
+    elif isinstance(value, list):
+        items = (_bounded_repr(item, limit) for item in value)
+        opening, closing = "[", "]"
+    else:
+        return repr(value)
+
+    parts = []
+    size = len(opening)  # Length rendered so far, without the closing bracket
+    for part in items:
+        if size >= limit:
+            break
+        size += len(part) + (2 if parts else 0)
+        parts.append(part)
+    return opening + ", ".join(parts) + closing
+
+
 def _format_sleep_duration(seconds: float) -> str:
     seconds = max(0, int(seconds))
     hours, rem = divmod(seconds, 3600)
-    minutes, _ = divmod(rem, 60)
+    minutes, secs = divmod(rem, 60)
     if hours > 0:
         return f"{hours}h {minutes}m"
-    return f"{minutes}m"
+    if minutes > 0:
+        return f"{minutes}m"
+    return f"{secs}s"
@@ -6,6 +6,7 @@ Functions for creating and configuring the Claude Agent SDK client.
 """
 
 import json
+import os
 from pathlib import Path
 
 from claude_agent_sdk import ClaudeSDKClient
@@ -14,7 +15,7 @@ from claude_agent_sdk.types import ClaudeAgentOptions, HookMatcher
 from core.security import bash_security_hook
 
 # Puppeteer MCP tools for browser automation
-PUPPETEER_TOOLS = [
+PUPPETEER_TOOLS = (
     "mcp__puppeteer__puppeteer_navigate",
     "mcp__puppeteer__puppeteer_screenshot",
     "mcp__puppeteer__puppeteer_click",
@@ -22,10 +23,15 @@ PUPPETEER_TOOLS = [
     "mcp__puppeteer__puppeteer_select",
     "mcp__puppeteer__puppeteer_hover",
     "mcp__puppeteer__puppeteer_evaluate",
-]
+)
+
+# System prompt shared by every session. Keep it byte-identical across runs:
+# the Claude Code CLI applies prompt caching to the system prompt and tool
+# definitions, and any per-session text here would invalidate the cache.
+SYSTEM_PROMPT = "You are an expert full-stack developer building a production-quality web application."
 
 # Built-in tools
-BUILTIN_TOOLS = [
+BUILTIN_TOOLS = (
     "Read",
     "Write",
     "Edit",
@@ -34,7 +40,49 @@ BUILTIN_TOOLS = [
     "Bash",
     "WebFetch",
     "WebSearch",
-]
+)
+
+# Comprehensive security settings written to .claude_settings.json
+# Note: Using relative paths ("./**") restricts access to project directory
+# since cwd is set to project_dir
+SECURITY_SETTINGS = {
+    "sandbox": {"enabled": True, "autoAllowBashIfSandboxed": True},
+    "permissions": {
+        "defaultMode": "acceptEdits",  # Auto-approve edits within allowed directories
+        "allow": [
+            # Allow all file operations within the project directory
+            "Read(*)",
+            "Write(./**)",
+            "Edit(./**)",
+            "Glob(*)",
+            "Grep(*)",
+            # Bash permission granted here, but actual commands are validated
+            # by the bash_security_hook (see security.py for allowed commands)
+            "Bash(*)",
+            # Web tools for documentation and search
+            "WebFetch(*)",
+            "WebSearch(*)",
+            # Allow MCP tools
+            *PUPPETEER_TOOLS,
+        ],
+    },
+}
+SECURITY_SETTINGS_JSON = json.dumps(SECURITY_SETTINGS, indent=2)
+
+# Client options that don't depend on the project directory, built once
+_BASE_OPTIONS_KWARGS = dict(
+    system_prompt=SYSTEM_PROMPT,
+    allowed_tools=(*BUILTIN_TOOLS, *PUPPETEER_TOOLS),
+    mcp_servers={
+        "puppeteer": {"command": "npx", "args": ["puppeteer-mcp-server"]},
+    },
+    hooks={
+        "PreToolUse": [
+            HookMatcher(matcher="Bash", hooks=[bash_security_hook]),
+        ],
+    },
+    max_turns=1000,
+)
 
 
 def create_client(project_dir: Path) -> ClaudeSDKClient:
@@ -52,43 +100,18 @@ def create_client(project_dir: Path) -> ClaudeSDKClient:
     2. Permissions - File operations restricted to project_dir only
     3. Security hooks - Bash commands validated against an allowlist
        (see security.py for ALLOWED_COMMANDS)
-    """
 
-    # Create comprehensive security settings
-    # Note: Using relative paths ("./**") restricts access to project directory
-    # since cwd is set to project_dir
-    security_settings = {
-        "sandbox": {"enabled": True, "autoAllowBashIfSandboxed": True},
-        "permissions": {
-            "defaultMode": "acceptEdits",  # Auto-approve edits within allowed directories
-            "allow": [
-                # Allow all file operations within the project directory
-                "Read(*)",
-                "Write(./**)",
-                "Edit(./**)",
-                "Glob(*)",
-                "Grep(*)",
-                # Bash permission granted here, but actual commands are validated
-                # by the bash_security_hook (see security.py for allowed commands)
-                "Bash(*)",
-                # Web tools for documentation and search
-                "WebFetch(*)",
-                "WebSearch(*)",
-                # Allow MCP tools
-                *PUPPETEER_TOOLS,
-            ],
-        },
-    }
+    The SDK reaches the API through a Claude Code CLI subprocess, which owns
+    the HTTP connection pool and the conversation. Create one client per
+    session so every session starts with a fresh context.
+    """
 
     # Ensure project directory exists before creating settings file
     project_dir.mkdir(parents=True, exist_ok=True)
 
     # Write settings to a file in the project directory (only if it doesn't exist)
     settings_file = project_dir / ".claude_settings.json"
-    if not settings_file.exists():
-        with open(settings_file, "w") as f:
-            json.dump(security_settings, f, indent=2)
-
+    if _write_security_settings(settings_file):
         print(f"Created security settings at {settings_file}")
         print("   - Sandbox enabled (OS-level bash isolation)")
         print(f"   - Filesystem restricted to: {project_dir.resolve()}")
@@ -98,21 +121,31 @@ def create_client(project_dir: Path) -> ClaudeSDKClient:
 
     return ClaudeSDKClient(
         options=ClaudeAgentOptions(
-            system_prompt="You are an expert full-stack developer building a production-quality web application.",
-            allowed_tools=[
-                *BUILTIN_TOOLS,
-                *PUPPETEER_TOOLS,
-            ],
-            mcp_servers={
-                "puppeteer": {"command": "npx", "args": ["puppeteer-mcp-server"]},
-            },
-            hooks={
-                "PreToolUse": [
-                    HookMatcher(matcher="Bash", hooks=[bash_security_hook]),
-                ],
-            },
-            max_turns=1000,
+            **_BASE_OPTIONS_KWARGS,
             cwd=str(project_dir.resolve()),
             settings=str(settings_file.resolve()),  # Use absolute path
         )
     )
+
+
+def _write_security_settings(settings_file: Path) -> bool:
+    """
+    Write SECURITY_SETTINGS to settings_file if it doesn't exist yet.
+
+    An existing file is left alone so hand edits survive. The JSON goes to a
+    temp file next to the target that is then moved into place, so an
+    interrupted write never leaves a partial settings file behind.
+
+    Returns:
+        True if the settings file was created
+    """
+    if settings_file.exists():
+        return False
+
+    tmp_file = settings_file.with_name(f"{settings_file.name}.tmp")
+    try:
+        tmp_file.write_text(SECURITY_SETTINGS_JSON)
+        os.replace(tmp_file, settings_file)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+    return True